@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Filesystem helpers shared by the registry tools.
+"""
+
+import os
+from typing import Iterator, Tuple
+
+
+def iter_subdirs(path: "str | os.PathLike") -> Iterator[Tuple[str, str]]:
+    """Yield (name, path) for each non-hidden subdirectory of path.
+
+    Uses os.scandir so directory-ness comes from the cached dirent type
+    instead of a stat call per entry.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith("."):
+                yield entry.name, entry.path
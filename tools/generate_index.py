@@ -8,11 +8,48 @@ This file is used by the Canonizer CLI for discovery and searching.
 
 import argparse
 import json
+import operator
+import os
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List
 
 import yaml
+from packaging.version import InvalidVersion, Version
+
+try:
+    # orjson serializes at C speed; fall back silently to stdlib json
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+from fs_utils import iter_subdirs
+from meta_cache import MetaCache
+
+# Prefer libyaml's C loader when available; it parses ~an order of magnitude
+# faster than the pure-Python SafeLoader.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _intern(value):
+    """Intern small repeated strings so duplicates share one object.
+
+    Fields like status, schema URIs and authors recur across thousands of
+    index entries; interning keeps one copy and lets later sorts and dict
+    lookups short-circuit on identity.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _version_key(version) -> Version:
+    """Sort key for semver version strings; unparseable versions sort lowest"""
+    try:
+        return Version(str(version))
+    except InvalidVersion:
+        return Version("0")
 
 
 class IndexGenerator:
@@ -22,6 +59,12 @@ class IndexGenerator:
         self.repo_root = repo_root
         self.transforms_dir = repo_root / "transforms"
         self.schemas_dir = repo_root / "schemas"
+        self.meta_cache = MetaCache(repo_root)
+        self.warnings: List[str] = []
+        # Precomputed prefix so relative paths come from string slicing
+        # instead of a Path.relative_to walk per entry
+        root_str = str(repo_root)
+        self._root_prefix = "" if root_str == "." else root_str + os.sep
 
     def generate(self) -> Dict:
         """Generate the complete registry index"""
@@ -30,6 +73,11 @@ class IndexGenerator:
         transforms = self._collect_transforms()
         schemas = self._collect_schemas()
 
+        # Warnings accumulated during collection are flushed in one write
+        # rather than a print per entry inside the walk
+        if self.warnings:
+            sys.stdout.write("\n".join(self.warnings) + "\n")
+
         index = {
             "version": "1.0.0",
             "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -40,6 +88,8 @@ class IndexGenerator:
         print(f"  Collected {len(transforms)} transform(s)")
         print(f"  Collected {len(schemas)} schema(s)")
 
+        self.meta_cache.save()
+
         return index
 
     def _collect_transforms(self) -> List[Dict]:
@@ -50,32 +100,28 @@ class IndexGenerator:
         # Collect all transforms
         all_transforms: Dict[str, List[Dict]] = {}
 
-        for category_dir in self.transforms_dir.iterdir():
-            if not category_dir.is_dir() or category_dir.name.startswith("."):
-                continue
-
-            for transform_dir in category_dir.iterdir():
-                if not transform_dir.is_dir() or transform_dir.name.startswith("."):
-                    continue
-
-                transform_id = f"{category_dir.name}/{transform_dir.name}"
+        for category_name, category_path in iter_subdirs(self.transforms_dir):
+            for transform_name, transform_path in iter_subdirs(category_path):
+                transform_id = sys.intern(f"{category_name}/{transform_name}")
 
                 if transform_id not in all_transforms:
                     all_transforms[transform_id] = []
 
-                for version_dir in transform_dir.iterdir():
-                    if not version_dir.is_dir() or version_dir.name.startswith("."):
-                        continue
-
-                    version_meta = self._read_transform_meta(version_dir)
+                for _version, version_path in iter_subdirs(transform_path):
+                    version_meta = self._read_transform_meta(Path(version_path))
                     if version_meta:
+                        # Parse the sort key once per entry rather than
+                        # comparing version strings lexicographically
+                        version_meta["_sort_key"] = _version_key(version_meta["version"])
                         all_transforms[transform_id].append(version_meta)
 
         # Convert to list format
         result = []
         for transform_id, versions in sorted(all_transforms.items()):
             # Sort versions (newest first)
-            versions.sort(key=lambda v: v["version"], reverse=True)
+            versions.sort(key=operator.itemgetter("_sort_key"), reverse=True)
+            for version_entry in versions:
+                del version_entry["_sort_key"]
 
             result.append({
                 "id": transform_id,
@@ -87,43 +133,74 @@ class IndexGenerator:
     def _read_transform_meta(self, version_dir: Path) -> Dict | None:
         """Read transform metadata and build version entry"""
         meta_file = version_dir / "spec.meta.yaml"
+        json_file = version_dir / "spec.meta.json"
 
-        if not meta_file.exists():
+        try:
+            meta_stat = os.stat(meta_file)
+        except OSError:
             return None
 
+        # Prefer the pre-baked JSON sidecar when it is at least as fresh as
+        # the YAML source (see tools/sync_meta_json.py)
         try:
-            with open(meta_file, "r") as f:
-                meta = yaml.safe_load(f)
-
-            # Extract relative path
-            rel_path = version_dir.relative_to(self.repo_root)
-
-            version_entry = {
-                "version": meta.get("version"),
-                "from_schema": meta.get("from_schema"),
-                "to_schema": meta.get("to_schema"),
-                "status": meta.get("status", "draft"),
-                "path": str(rel_path) + "/",
-            }
+            json_is_fresh = os.stat(json_file).st_mtime_ns >= meta_stat.st_mtime_ns
+        except OSError:
+            json_is_fresh = False
+
+        meta = None
+        if json_is_fresh:
+            # The sidecar is a derived artifact; if it cannot be read or does
+            # not hold a mapping, fall back to the YAML source of truth
+            # rather than dropping the entry over it
+            try:
+                sidecar = _json_loads(json_file.read_bytes())
+            except (OSError, ValueError):
+                sidecar = None
+            if isinstance(sidecar, dict):
+                meta = sidecar
+
+        # Catch only parse and read failures: CSafeLoader raises yaml.YAMLError
+        # subclasses
+        if meta is None:
+            try:
+                meta = self.meta_cache.get(str(meta_file), meta_stat)
+                if meta is None:
+                    with open(meta_file, "rb") as f:
+                        meta = yaml.load(f, Loader=Loader)
+                    self.meta_cache.put(str(meta_file), meta_stat, meta)
+            except (yaml.YAMLError, OSError, ValueError) as e:
+                self.warnings.append(f"  Warning: Could not read {meta_file}: {e}")
+                return None
+
+        if not isinstance(meta, dict):
+            self.warnings.append(f"  Warning: Could not read {meta_file}: metadata is not a mapping")
+            return None
+
+        # Extract relative path
+        rel_path = str(version_dir)[len(self._root_prefix):].replace(os.sep, "/")
 
-            # Add optional fields
-            if "checksum" in meta:
-                version_entry["checksum"] = meta["checksum"]
+        version_entry = {
+            "version": meta.get("version"),
+            "from_schema": _intern(meta.get("from_schema")),
+            "to_schema": _intern(meta.get("to_schema")),
+            "status": _intern(meta.get("status", "draft")),
+            "path": rel_path + "/",
+        }
 
-            if "provenance" in meta:
-                version_entry["author"] = meta["provenance"].get("author", "Unknown")
-                version_entry["created_utc"] = meta["provenance"].get("created_utc")
+        # Add optional fields
+        if "checksum" in meta:
+            version_entry["checksum"] = meta["checksum"]
 
-            if "compat" in meta and "from_schema_range" in meta["compat"]:
-                version_entry["compat"] = {
-                    "from_schema_range": meta["compat"]["from_schema_range"]
-                }
+        if isinstance(meta.get("provenance"), dict):
+            version_entry["author"] = _intern(meta["provenance"].get("author", "Unknown"))
+            version_entry["created_utc"] = meta["provenance"].get("created_utc")
 
-            return version_entry
+        if isinstance(meta.get("compat"), dict) and "from_schema_range" in meta["compat"]:
+            version_entry["compat"] = {
+                "from_schema_range": meta["compat"]["from_schema_range"]
+            }
 
-        except Exception as e:
-            print(f"  Warning: Could not read {meta_file}: {e}")
-            return None
+        return version_entry
 
     def _collect_schemas(self) -> List[Dict]:
         """Collect all schemas"""
@@ -132,40 +209,39 @@ class IndexGenerator:
 
         schemas = []
 
-        for vendor_dir in self.schemas_dir.iterdir():
-            if not vendor_dir.is_dir() or vendor_dir.name.startswith("."):
+        # One pattern-driven traversal instead of nested directory loops;
+        # glob prunes non-matching intermediate levels in a single pass
+        for schema_file in self.schemas_dir.glob("*/*/jsonschema/*.json"):
+            vendor_name, schema_name, _, filename = schema_file.relative_to(self.schemas_dir).parts
+            if vendor_name.startswith(".") or schema_name.startswith("."):
                 continue
 
-            for schema_dir in vendor_dir.iterdir():
-                if not schema_dir.is_dir() or schema_dir.name.startswith("."):
-                    continue
+            # Parse Iglu-style version from filename
+            version_str = filename[:-len(".json")]  # e.g., "1-0-0"
 
-                jsonschema_dir = schema_dir / "jsonschema"
-                if not jsonschema_dir.exists():
-                    continue
+            # Build Iglu URI
+            uri = f"iglu:{vendor_name}/{schema_name}/jsonschema/{version_str}"
 
-                for schema_file in jsonschema_dir.glob("*.json"):
-                    # Parse Iglu-style version from filename
-                    version_str = schema_file.stem  # e.g., "1-0-0"
+            # Get relative path
+            rel_path = str(schema_file)[len(self._root_prefix):].replace(os.sep, "/")
 
-                    # Build Iglu URI
-                    uri = f"iglu:{vendor_dir.name}/{schema_dir.name}/jsonschema/{version_str}"
-
-                    # Get relative path
-                    rel_path = schema_file.relative_to(self.repo_root)
-
-                    schemas.append({
-                        "uri": uri,
-                        "path": str(rel_path),
-                    })
+            schemas.append({
+                "uri": uri,
+                "path": rel_path,
+            })
 
         return sorted(schemas, key=lambda s: s["uri"])
 
     def write_index(self, index: Dict, output_path: Path):
         """Write index to file"""
-        with open(output_path, "w") as f:
-            json.dump(index, f, indent=2, sort_keys=False)
-            f.write("\n")  # Add trailing newline
+        if orjson is not None:
+            data = orjson.dumps(
+                index, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            )
+        else:
+            data = (json.dumps(index, indent=2, sort_keys=False) + "\n").encode("utf-8")
+
+        output_path.write_bytes(data)
 
         print(f"  ✓ Wrote {output_path}")
 
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Shared cache of parsed spec.meta.yaml contents.
+
+generate_index.py and validate.py each parse every spec.meta.yaml in the
+registry, and CI runs them back-to-back. This module persists parse results
+in a _meta_cache.json sidecar keyed by (path, mtime_ns, size) so the second
+tool — and warm re-runs — replace YAML parsing with a JSON lookup. JSON
+decode is roughly an order of magnitude cheaper than a YAML load even under
+libyaml, so warm runs are bounded by the stat calls alone.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+CACHE_FILENAME = "_meta_cache.json"
+
+
+class MetaCache:
+    """On-disk cache mapping meta file path -> (mtime_ns, size, parsed dict)"""
+
+    def __init__(self, repo_root: Path):
+        self.cache_path = repo_root / CACHE_FILENAME
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = False
+
+        try:
+            with open(self.cache_path, "r") as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self._entries = entries
+        except (OSError, ValueError):
+            # Missing or corrupt cache: start cold
+            pass
+
+    def get(self, path: str, stat: os.stat_result) -> Optional[Dict]:
+        """Return the cached parse for path if its (mtime_ns, size) is unchanged"""
+        entry = self._entries.get(path)
+        if (
+            entry is not None
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+        ):
+            return entry["meta"]
+        return None
+
+    def put(self, path: str, stat: os.stat_result, meta: Dict):
+        """Record the parse result for path under its current (mtime_ns, size)"""
+        entry = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "meta": meta,
+        }
+
+        # Parsed YAML can hold non-JSON types (e.g. an unquoted timestamp
+        # becomes a datetime); skip those entries rather than letting one odd
+        # file break serialization of the whole cache
+        try:
+            json.dumps(entry)
+        except (TypeError, ValueError):
+            return
+
+        self._entries[path] = entry
+        self._dirty = True
+
+    def save(self):
+        """Write the cache back to disk if anything changed"""
+        if not self._dirty:
+            return
+
+        try:
+            with open(self.cache_path, "w") as f:
+                json.dump(self._entries, f)
+        except (OSError, TypeError, ValueError):
+            # The cache is best-effort; never fail the run over it
+            pass
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Sync spec.meta.json sidecars
+
+Writes a normalized spec.meta.json next to every spec.meta.yaml whose sidecar
+is missing or stale. validate.py and generate_index.py prefer the JSON
+sidecar, which parses far faster than YAML, and fall back to the YAML source
+when no fresh sidecar exists. Run this after editing transform metadata
+(e.g. from a pre-commit hook).
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+import yaml
+
+from fs_utils import iter_subdirs
+
+try:
+    # orjson serializes at C speed; fall back silently to stdlib json
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer libyaml's C loader when available; it parses ~an order of magnitude
+# faster than the pure-Python SafeLoader.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def sync_meta_json(repo_root: Path) -> int:
+    """Write missing or stale spec.meta.json sidecars; return count written"""
+    transforms_dir = repo_root / "transforms"
+
+    if not transforms_dir.exists():
+        return 0
+
+    written = 0
+
+    for _category, category_path in iter_subdirs(transforms_dir):
+        for _transform, transform_path in iter_subdirs(category_path):
+            for _version, version_path in iter_subdirs(transform_path):
+                yaml_file = os.path.join(version_path, "spec.meta.yaml")
+                json_file = os.path.join(version_path, "spec.meta.json")
+
+                try:
+                    yaml_stat = os.stat(yaml_file)
+                except OSError:
+                    continue
+
+                try:
+                    if os.stat(json_file).st_mtime_ns >= yaml_stat.st_mtime_ns:
+                        continue  # sidecar is already fresh
+                except OSError:
+                    pass
+
+                with open(yaml_file, "rb") as f:
+                    meta = yaml.load(f, Loader=Loader)
+
+                # Parsed YAML can hold non-JSON types (e.g. an unquoted
+                # timestamp becomes a datetime); skip those files so the
+                # tools keep reading their YAML source directly
+                try:
+                    if orjson is not None:
+                        data = orjson.dumps(
+                            meta, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+                        )
+                    else:
+                        data = (json.dumps(meta, indent=2) + "\n").encode("utf-8")
+                except (TypeError, ValueError) as e:
+                    print(f"  Warning: Could not serialize {yaml_file}: {e}")
+                    continue
+
+                with open(json_file, "wb") as f:
+                    f.write(data)
+
+                print(f"  ✓ Wrote {json_file}")
+                written += 1
+
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write spec.meta.json sidecars for changed spec.meta.yaml files")
+    parser.add_argument("--repo-root", type=Path, default=Path.cwd(), help="Repository root directory")
+
+    args = parser.parse_args()
+
+    written = sync_meta_json(args.repo_root)
+
+    print(f"✅ Synced {written} spec.meta.json sidecar(s)")
+
+
+if __name__ == "__main__":
+    main()
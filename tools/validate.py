@@ -14,17 +14,34 @@ Validates transforms and schemas in the registry:
 import argparse
 import hashlib
 import json
+import mmap
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
 import yaml
 
+from fs_utils import iter_subdirs
+from meta_cache import MetaCache
+
+# Prefer libyaml's C loader when available; it parses ~an order of magnitude
+# faster than the pure-Python SafeLoader.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 try:
     from jsonschema import Draft7Validator, ValidationError as JSONSchemaValidationError
     JSONSCHEMA_AVAILABLE = True
+    # Compile the Draft-7 metaschema validator once; check_schema would
+    # rebuild it for every schema file. The format checker matches what
+    # check_schema applies, so broken "pattern" regexes still fail.
+    _META_VALIDATOR = Draft7Validator(
+        Draft7Validator.META_SCHEMA, format_checker=Draft7Validator.FORMAT_CHECKER
+    )
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
+    _META_VALIDATOR = None
     print("Warning: jsonschema not available, schema validation will be skipped")
 
 try:
@@ -34,12 +51,112 @@ except ImportError:
     JSONATA_AVAILABLE = False
     print("Warning: jsonata-python not available, golden tests will be skipped")
 
+try:
+    # orjson decodes several times faster than stdlib json; fall back silently
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 
 class ValidationError(Exception):
     """Validation error exception"""
     pass
 
 
+# A golden test job:
+# (jsonata_file, expression_str, input_file, expected_file, transform_id, version)
+GoldenTest = Tuple[Path, str, Path, Path, str, str]
+
+# Specs above this size are hashed through mmap rather than a read() copy
+_MMAP_HASH_THRESHOLD = 64 * 1024
+
+# Required top-level keys in spec.meta.yaml, built once instead of per
+# transform. A tuple, not a set: it is only ever iterated, and a fixed order
+# keeps "Missing required field" errors stable under hash randomization.
+_REQUIRED_META_FIELDS = (
+    "id", "version", "engine", "from_schema", "to_schema",
+    "tests", "checksum", "provenance", "status",
+)
+
+# Per-process cache of compiled JSONata expressions keyed by spec path.
+# Pool workers are reused across jobs, so a transform with N golden tests
+# compiles its expression once per worker instead of once per test.
+_expr_cache: Dict[str, "jsonata.Jsonata"] = {}
+
+
+def _canonical_digest(value) -> "bytes | None":
+    """Digest of a value's canonical (sorted-key) JSON form.
+
+    Returns None when the value cannot be serialized, in which case the
+    caller must fall back to a structural compare.
+    """
+    try:
+        if orjson is not None:
+            data = orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        else:
+            data = json.dumps(value, sort_keys=True).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _compile_jsonata(jsonata_file: Path, expression_str: str) -> "jsonata.Jsonata":
+    """Return the compiled expression, memoized per process by spec path"""
+    key = str(jsonata_file)
+    expr = _expr_cache.get(key)
+    if expr is None:
+        expr = jsonata.Jsonata(expression_str)
+        _expr_cache[key] = expr
+    return expr
+
+
+def _run_golden_test_worker(job: GoldenTest) -> Tuple[bool, List[str]]:
+    """Run a single golden test in a worker process.
+
+    Top-level function so it is picklable by ProcessPoolExecutor. Returns
+    (ok, error messages) for aggregation in the parent.
+    """
+    jsonata_file, expression_str, input_file, expected_file, transform_id, version = job
+    errors: List[str] = []
+
+    try:
+        # Load input
+        with open(input_file, "rb") as f:
+            input_data = _json_loads(f.read())
+
+        # Load expected output
+        with open(expected_file, "rb") as f:
+            expected_output = _json_loads(f.read())
+
+        # Execute transform (compilation is memoized per worker)
+        expr = _compile_jsonata(jsonata_file, expression_str)
+        actual_output = expr.evaluate(input_data)
+
+        # Compare outputs: matching digests of the canonical JSON form settle
+        # the common passing case without a Python-level structural walk.
+        # Mismatched digests (e.g. 1 vs 1.0 serializing differently) defer to
+        # the structural compare before calling the test failed.
+        expected_digest = _canonical_digest(expected_output)
+        actual_digest = _canonical_digest(actual_output)
+        if (
+            expected_digest is None
+            or expected_digest != actual_digest
+        ) and actual_output != expected_output:
+            errors.append(f"{transform_id}@{version}: Golden test failed")
+            errors.append(f"  Input: {input_file}")
+            errors.append(f"  Expected: {json.dumps(expected_output, indent=2)[:200]}...")
+            errors.append(f"  Actual: {json.dumps(actual_output, indent=2)[:200]}...")
+            return False, errors
+
+        return True, errors
+
+    except Exception as e:
+        errors.append(f"{transform_id}@{version}: Golden test error: {e}")
+        return False, errors
+
+
 class RegistryValidator:
     """Validates the canonizer registry structure and content"""
 
@@ -49,6 +166,8 @@ class RegistryValidator:
         self.schemas_dir = repo_root / "schemas"
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self.meta_cache = MetaCache(repo_root)
+        self._golden_tests: List[GoldenTest] = []
 
     def validate_all(self) -> bool:
         """Run all validation checks"""
@@ -69,9 +188,10 @@ class RegistryValidator:
         else:
             print("❌ VALIDATION FAILED")
             print()
-            print(f"Errors: {len(self.errors)}")
-            for error in self.errors:
-                print(f"  - {error}")
+            # One buffered write for the whole error list instead of a
+            # print (and flush) per entry
+            sys.stdout.write(f"Errors: {len(self.errors)}\n")
+            sys.stdout.writelines(f"  - {error}\n" for error in self.errors)
         print("=" * 80)
 
         return success
@@ -104,24 +224,17 @@ class RegistryValidator:
             return False
 
         transform_ids: Set[Tuple[str, str]] = set()
-        transform_count = 0
+        passed: Set[Tuple[str, str]] = set()
         success = True
+        self._golden_tests = []
 
-        for category_dir in self.transforms_dir.iterdir():
-            if not category_dir.is_dir() or category_dir.name.startswith("."):
-                continue
-
-            for transform_dir in category_dir.iterdir():
-                if not transform_dir.is_dir() or transform_dir.name.startswith("."):
-                    continue
-
-                for version_dir in transform_dir.iterdir():
-                    if not version_dir.is_dir() or version_dir.name.startswith("."):
-                        continue
-
-                    transform_id = f"{category_dir.name}/{transform_dir.name}"
-                    version = version_dir.name
+        # First pass: gather (version_dir, id, version) triples
+        jobs: List[Tuple[Path, str, str]] = []
+        for category_name, category_path in iter_subdirs(self.transforms_dir):
+            for transform_name, transform_path in iter_subdirs(category_path):
+                transform_id = f"{category_name}/{transform_name}"
 
+                for version, version_path in iter_subdirs(transform_path):
                     # Check for duplicate (id, version)
                     if (transform_id, version) in transform_ids:
                         self.errors.append(f"Duplicate transform: {transform_id}@{version}")
@@ -129,19 +242,45 @@ class RegistryValidator:
                         continue
 
                     transform_ids.add((transform_id, version))
+                    jobs.append((Path(version_path), transform_id, version))
+
+        # Metadata parsing and checksum hashing are I/O- and hash-bound and
+        # release the GIL, so fan the per-transform validation out across
+        # threads. Results come back in submission order, so error output
+        # stays deterministic.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            results = executor.map(lambda job: self._validate_transform(*job), jobs)
+            for (_, transform_id, version), (ok, errors, golden_tests) in zip(jobs, results):
+                self.errors.extend(errors)
+                self._golden_tests.extend(golden_tests)
+                if ok:
+                    passed.add((transform_id, version))
+                else:
+                    success = False
 
-                    # Validate transform
-                    if not self._validate_transform(version_dir, transform_id, version):
-                        success = False
-                    else:
-                        transform_count += 1
+        # Golden tests collected during the walk run in parallel at the end
+        failed = self._run_golden_tests()
+        if failed:
+            success = False
+            passed -= failed
 
-        print(f"  ✓ Validated {transform_count} transforms")
+        self.meta_cache.save()
+
+        print(f"  ✓ Validated {len(passed)} transforms")
         return success
 
-    def _validate_transform(self, transform_dir: Path, expected_id: str, expected_version: str) -> bool:
-        """Validate a single transform"""
+    def _validate_transform(
+        self, transform_dir: Path, expected_id: str, expected_version: str
+    ) -> Tuple[bool, List[str], List[GoldenTest]]:
+        """Validate a single transform.
+
+        Runs on a worker thread, so errors and golden-test jobs are returned
+        to the caller for ordered aggregation rather than appended to shared
+        state.
+        """
         success = True
+        errors: List[str] = []
+        golden_tests: List[GoldenTest] = []
 
         # Check required files
         jsonata_file = transform_dir / "spec.jsonata"
@@ -149,116 +288,157 @@ class RegistryValidator:
         tests_dir = transform_dir / "tests"
 
         if not jsonata_file.exists():
-            self.errors.append(f"{expected_id}@{expected_version}: Missing spec.jsonata")
-            return False
+            errors.append(f"{expected_id}@{expected_version}: Missing spec.jsonata")
+            return False, errors, golden_tests
 
-        if not meta_file.exists():
-            self.errors.append(f"{expected_id}@{expected_version}: Missing spec.meta.yaml")
-            return False
+        # One stat answers both "does it exist" and the cache fingerprint
+        try:
+            meta_stat = os.stat(meta_file)
+        except OSError:
+            errors.append(f"{expected_id}@{expected_version}: Missing spec.meta.yaml")
+            return False, errors, golden_tests
 
         if not tests_dir.exists() or not tests_dir.is_dir():
-            self.errors.append(f"{expected_id}@{expected_version}: Missing tests/ directory")
-            return False
+            errors.append(f"{expected_id}@{expected_version}: Missing tests/ directory")
+            return False, errors, golden_tests
 
-        # Validate metadata
+        # Prefer the pre-baked JSON sidecar when it is at least as fresh as
+        # the YAML source (see tools/sync_meta_json.py)
+        json_file = transform_dir / "spec.meta.json"
         try:
-            with open(meta_file, "r") as f:
-                meta = yaml.safe_load(f)
-        except Exception as e:
-            self.errors.append(f"{expected_id}@{expected_version}: Invalid YAML: {e}")
-            return False
+            json_is_fresh = os.stat(json_file).st_mtime_ns >= meta_stat.st_mtime_ns
+        except OSError:
+            json_is_fresh = False
+
+        meta = None
+        if json_is_fresh:
+            # The sidecar is a derived artifact; if it cannot be read or does
+            # not hold a mapping, fall back to the YAML source of truth
+            # rather than failing the transform over it
+            try:
+                sidecar = _json_loads(json_file.read_bytes())
+            except (OSError, ValueError):
+                sidecar = None
+            if isinstance(sidecar, dict):
+                meta = sidecar
+
+        # Validate metadata (parse cached across tools by (path, mtime, size)).
+        # Catch only parse and read failures: CSafeLoader raises yaml.YAMLError
+        # subclasses.
+        if meta is None:
+            try:
+                meta = self.meta_cache.get(str(meta_file), meta_stat)
+                if meta is None:
+                    with open(meta_file, "rb") as f:
+                        meta = yaml.load(f, Loader=Loader)
+                    self.meta_cache.put(str(meta_file), meta_stat, meta)
+            except (yaml.YAMLError, OSError, ValueError) as e:
+                errors.append(f"{expected_id}@{expected_version}: Invalid YAML: {e}")
+                return False, errors, golden_tests
+
+        if not isinstance(meta, dict):
+            errors.append(f"{expected_id}@{expected_version}: Invalid YAML: metadata is not a mapping")
+            return False, errors, golden_tests
 
         # Check required fields
-        required_fields = ["id", "version", "engine", "from_schema", "to_schema", "tests", "checksum", "provenance", "status"]
-        for field in required_fields:
+        for field in _REQUIRED_META_FIELDS:
             if field not in meta:
-                self.errors.append(f"{expected_id}@{expected_version}: Missing required field: {field}")
+                errors.append(f"{expected_id}@{expected_version}: Missing required field: {field}")
                 success = False
 
+        get = meta.get
+
         # Validate ID matches directory
-        if meta.get("id") != expected_id:
-            self.errors.append(f"{expected_id}@{expected_version}: ID mismatch (expected {expected_id}, got {meta.get('id')})")
+        if get("id") != expected_id:
+            errors.append(f"{expected_id}@{expected_version}: ID mismatch (expected {expected_id}, got {get('id')})")
             success = False
 
         # Validate version matches directory
-        if meta.get("version") != expected_version:
-            self.errors.append(f"{expected_id}@{expected_version}: Version mismatch (expected {expected_version}, got {meta.get('version')})")
+        if get("version") != expected_version:
+            errors.append(f"{expected_id}@{expected_version}: Version mismatch (expected {expected_version}, got {get('version')})")
             success = False
 
         # Validate engine
-        if meta.get("engine") != "jsonata":
-            self.errors.append(f"{expected_id}@{expected_version}: Invalid engine (must be 'jsonata')")
+        if get("engine") != "jsonata":
+            errors.append(f"{expected_id}@{expected_version}: Invalid engine (must be 'jsonata')")
             success = False
 
+        # The spec file is read at most once; checksum verification and
+        # golden tests share its content
+        jsonata_content = None
+
         # Validate checksum
         if "checksum" in meta and "jsonata_sha256" in meta["checksum"]:
             expected_checksum = meta["checksum"]["jsonata_sha256"]
-            actual_checksum = self._compute_sha256(jsonata_file)
+            jsonata_content, actual_checksum = self._compute_sha256(jsonata_file)
 
             if expected_checksum != actual_checksum:
-                self.errors.append(f"{expected_id}@{expected_version}: Checksum mismatch (expected {expected_checksum}, got {actual_checksum})")
+                errors.append(f"{expected_id}@{expected_version}: Checksum mismatch (expected {expected_checksum}, got {actual_checksum})")
                 success = False
 
-        # Validate golden tests
+        # Queue golden tests; they run in parallel after the directory walk
         if JSONATA_AVAILABLE and "tests" in meta:
+            try:
+                if jsonata_content is None:
+                    jsonata_content = jsonata_file.read_bytes()
+                expression_str = jsonata_content.decode("utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                errors.append(f"{expected_id}@{expected_version}: Could not read spec.jsonata: {e}")
+                return False, errors, golden_tests
+
             for test_spec in meta["tests"]:
                 input_file = transform_dir / test_spec["input"]
                 expected_file = transform_dir / test_spec["expect"]
 
                 if not input_file.exists():
-                    self.errors.append(f"{expected_id}@{expected_version}: Test input not found: {test_spec['input']}")
+                    errors.append(f"{expected_id}@{expected_version}: Test input not found: {test_spec['input']}")
                     success = False
                     continue
 
                 if not expected_file.exists():
-                    self.errors.append(f"{expected_id}@{expected_version}: Test expected output not found: {test_spec['expect']}")
+                    errors.append(f"{expected_id}@{expected_version}: Test expected output not found: {test_spec['expect']}")
                     success = False
                     continue
 
-                if not self._run_golden_test(jsonata_file, input_file, expected_file, expected_id, expected_version):
-                    success = False
+                golden_tests.append(
+                    (jsonata_file, expression_str, input_file, expected_file, expected_id, expected_version)
+                )
 
-        return success
+        return success, errors, golden_tests
 
-    def _compute_sha256(self, file_path: Path) -> str:
-        """Compute SHA256 hash of a file"""
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            sha256.update(f.read())
-        return sha256.hexdigest()
+    def _compute_sha256(self, file_path: Path) -> Tuple[bytes, str]:
+        """Read a file once and return (content, SHA256 hexdigest)"""
+        # Large specs hash straight from the page cache via mmap, so OpenSSL
+        # consumes the buffer zero-copy with the GIL released; the content is
+        # still materialized afterwards for the golden-test path
+        if os.path.getsize(file_path) > _MMAP_HASH_THRESHOLD:
+            with open(file_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest = hashlib.sha256(mm).hexdigest()
+                    return bytes(mm), digest
 
-    def _run_golden_test(self, jsonata_file: Path, input_file: Path, expected_file: Path, transform_id: str, version: str) -> bool:
-        """Run a golden test"""
-        try:
-            # Load JSONata expression
-            with open(jsonata_file, "r") as f:
-                expression_str = f.read()
-
-            # Load input
-            with open(input_file, "r") as f:
-                input_data = json.load(f)
-
-            # Load expected output
-            with open(expected_file, "r") as f:
-                expected_output = json.load(f)
-
-            # Execute transform
-            expr = jsonata.Jsonata(expression_str)
-            actual_output = expr.evaluate(input_data)
-
-            # Compare outputs
-            if actual_output != expected_output:
-                self.errors.append(f"{transform_id}@{version}: Golden test failed")
-                self.errors.append(f"  Input: {input_file}")
-                self.errors.append(f"  Expected: {json.dumps(expected_output, indent=2)[:200]}...")
-                self.errors.append(f"  Actual: {json.dumps(actual_output, indent=2)[:200]}...")
-                return False
+        content = file_path.read_bytes()
+        return content, hashlib.sha256(content).hexdigest()
 
-            return True
+    def _run_golden_tests(self) -> Set[Tuple[str, str]]:
+        """Run all queued golden tests across a process pool.
 
-        except Exception as e:
-            self.errors.append(f"{transform_id}@{version}: Golden test error: {e}")
-            return False
+        Each (transform, test) tuple is independent CPU-bound work, so they
+        scale with cores. Returns the set of failing (id, version) pairs.
+        """
+        failed: Set[Tuple[str, str]] = set()
+
+        if not self._golden_tests:
+            return failed
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(_run_golden_test_worker, self._golden_tests)
+            for job, (ok, errors) in zip(self._golden_tests, results):
+                self.errors.extend(errors)
+                if not ok:
+                    failed.add((job[4], job[5]))
+
+        return failed
 
     def check_schemas(self) -> bool:
         """Validate all schemas"""
@@ -272,23 +452,51 @@ class RegistryValidator:
         schema_count = 0
         success = True
 
-        for vendor_dir in self.schemas_dir.iterdir():
-            if not vendor_dir.is_dir() or vendor_dir.name.startswith("."):
+        # Schemas that validated in a previous run and are untouched since
+        # (same size and mtime_ns) skip the parse + metaschema check; only
+        # valid results are cached so failures are re-reported every run.
+        # The fingerprint includes whether jsonschema was importable, so a
+        # run that could only JSON-parse does not satisfy later runs that
+        # can run the full metaschema check.
+        cache_path = self.repo_root / ".validate_cache.json"
+        try:
+            with open(cache_path, "r") as f:
+                schema_cache = json.load(f)
+            if not isinstance(schema_cache, dict):
+                schema_cache = {}
+        except (OSError, ValueError):
+            schema_cache = {}
+
+        new_cache: Dict[str, List] = {}
+
+        # One pattern-driven traversal instead of nested directory loops;
+        # glob prunes non-matching intermediate levels in a single pass
+        for schema_file in self.schemas_dir.glob("*/*/jsonschema/*.json"):
+            vendor_name, schema_name = schema_file.relative_to(self.schemas_dir).parts[:2]
+            if vendor_name.startswith(".") or schema_name.startswith("."):
                 continue
 
-            for schema_dir in vendor_dir.iterdir():
-                if not schema_dir.is_dir() or schema_dir.name.startswith("."):
-                    continue
+            stat = os.stat(schema_file)
+            key = str(schema_file)
+            fingerprint = [stat.st_size, stat.st_mtime_ns, JSONSCHEMA_AVAILABLE]
 
-                jsonschema_dir = schema_dir / "jsonschema"
-                if not jsonschema_dir.exists():
-                    continue
+            if schema_cache.get(key) == fingerprint:
+                new_cache[key] = fingerprint
+                schema_count += 1
+                continue
 
-                for schema_file in jsonschema_dir.glob("*.json"):
-                    if not self._validate_schema(schema_file):
-                        success = False
-                    else:
-                        schema_count += 1
+            if not self._validate_schema(schema_file):
+                success = False
+            else:
+                new_cache[key] = fingerprint
+                schema_count += 1
+
+        try:
+            with open(cache_path, "w") as f:
+                json.dump(new_cache, f)
+        except OSError:
+            # The cache is best-effort; never fail the run over it
+            pass
 
         print(f"  ✓ Validated {schema_count} schemas")
         return success
@@ -307,9 +515,14 @@ class RegistryValidator:
             if "$schema" not in schema:
                 self.warnings.append(f"{schema_file}: Missing $schema field (recommended)")
 
-            # Validate with jsonschema if available
+            # Validate with jsonschema if available, reusing the compiled
+            # metaschema validator and reporting all errors at once
             if JSONSCHEMA_AVAILABLE:
-                Draft7Validator.check_schema(schema)
+                meta_errors = list(_META_VALIDATOR.iter_errors(schema))
+                if meta_errors:
+                    for error in meta_errors:
+                        self.errors.append(f"{schema_file}: Invalid JSON Schema: {error.message}")
+                    return False
 
             return True
 